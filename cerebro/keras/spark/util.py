@@ -62,7 +62,8 @@ class TFKerasUtil(object):
 
         def fn(reader, transformation_fn):
             from petastorm.tf_utils import make_petastorm_dataset
-            dataset = make_petastorm_dataset(reader)
+            # Applied first so that options set by the user's transformation_fn take precedence.
+            dataset = make_petastorm_dataset(reader).with_options(_make_dataset_options())
 
             # Decompress sparse data if necessary
             if has_sparse_col:
@@ -163,6 +164,20 @@ def _prep_data_fn(has_sparse_col, input_names, label_columns,
     return prep
 
 
+def _make_dataset_options():
+    options = tf.data.Options()
+    # Data is already sharded across the workers by the petastorm readers.
+    options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.OFF
+
+    # Not all of these static optimizations are available in older TF versions.
+    optimization = options.experimental_optimization
+    for name in ['map_parallelization', 'parallel_batch', 'map_fusion', 'map_and_batch_fusion', 'filter_fusion']:
+        if hasattr(optimization, name):
+            setattr(optimization, name, True)
+
+    return options
+
+
 def _serialize_keras_model(model, save_model_fn):
     """Serialize model into byte array encoded into base 64."""
     bio = io.BytesIO()
@@ -18,10 +18,12 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import contextlib
+import logging
 import os
 import re
 import shutil
 import tempfile
+import threading
 
 import pyarrow as pa
 from pyarrow import fs
@@ -29,6 +31,39 @@ from pyarrow import fs
 from .base import FilesystemStore
 from .base import filter_dict
 
+logger = logging.getLogger(__name__)
+
+# HDFS connections are expensive to set up (JNI/JVM startup and a NameNode handshake), so each process keeps one
+# connection per distinct set of connection arguments and shares it across stores and sync functions. A connection
+# is only evicted when the HDFS client itself fails on it (see `HDFSStore._discard_filesystem`); missing files and
+# local I/O errors keep it cached. The cache is only reached through the module-level functions below, which cloudpickle serializes by
+# reference; closures shipped to executors therefore never carry the lock or the driver's connections.
+_HDFS_CONNECTIONS = {}
+_HDFS_CONNECTIONS_LOCK = threading.Lock()
+
+# Chunk size used when streaming local files to HDFS (the pyarrow default is 64 KiB). The upload queues up to ~51
+# chunks in memory, so this bounds each in-flight upload at ~50 MiB, times SYNC_MAX_WORKERS concurrent uploads.
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+
+def _connection_key(hdfs_kwargs):
+    return tuple(sorted((k, tuple(sorted(v.items())) if isinstance(v, dict) else v)
+                        for k, v in hdfs_kwargs.items()))
+
+
+def _get_connection(key, hdfs_kwargs):
+    with _HDFS_CONNECTIONS_LOCK:
+        hdfs = _HDFS_CONNECTIONS.get(key)
+        if hdfs is None:
+            hdfs = pa.hdfs.connect(**hdfs_kwargs)
+            _HDFS_CONNECTIONS[key] = hdfs
+        return hdfs
+
+
+def _discard_connection(hdfs):
+    with _HDFS_CONNECTIONS_LOCK:
+        for key in [k for k, v in _HDFS_CONNECTIONS.items() if v is hdfs]:
+            del _HDFS_CONNECTIONS[key]
 
 
 class HDFSStore(FilesystemStore):
@@ -58,6 +93,7 @@ class HDFSStore(FilesystemStore):
 
     FS_PREFIX = 'hdfs://'
     URL_PATTERN = '^(?:(.+://))?(?:([^/:]+))?(?:[:]([0-9]+))?(?:(.+))?$'
+    _URL_RE = re.compile(URL_PATTERN)
 
     def __init__(self, prefix_path, train_path=None, val_path=None, runs_path=None, temp_dir=None,
                  host=None, port=None, user=None, kerb_ticket=None,
@@ -83,7 +119,7 @@ class HDFSStore(FilesystemStore):
                                         train_path=train_path, val_path=val_path, runs_path=runs_path)
 
     def parse_url(self, url):
-        match = re.search(self.URL_PATTERN, url)
+        match = self._URL_RE.match(url)
         prefix = match.group(1)
         host = match.group(2)
 
@@ -96,26 +132,49 @@ class HDFSStore(FilesystemStore):
         return prefix, host, port, path, path_offset
 
     def exists(self, path):
-        return self.get_filesystem().exists(self.get_localized_path(path))
+        hdfs = self.get_filesystem()
+        try:
+            return hdfs.exists(self.get_localized_path(path))
+        except OSError as e:
+            self._discard_filesystem(hdfs, e)
+            raise
 
     def path_prefix(self):
         return self._url_prefix
 
     def get_filesystem(self):
+        if self._hdfs is None:
+            self._hdfs = self._get_filesystem_fn()()
         return self._hdfs
 
     def _get_filesystem_fn(self):
         hdfs_kwargs = self._hdfs_kwargs
 
         hdfs_kwargs = filter_dict(hdfs_kwargs, pa.hdfs.connect)
+        key = _connection_key(hdfs_kwargs)
 
         def fn():
-            return pa.hdfs.connect(**hdfs_kwargs)
+            return _get_connection(key, hdfs_kwargs)
 
         return fn
 
+    def _discard_filesystem(self, hdfs, error):
+        # Called with an error raised by the HDFS client on `hdfs`. A missing file says nothing about the
+        # connection; anything else may mean it is broken, so reconnect on next use.
+        if isinstance(error, FileNotFoundError):
+            return
+        _discard_connection(hdfs)
+        if self._hdfs is hdfs:
+            self._hdfs = None
+
+    def __getstate__(self):
+        # The native HDFS handle cannot be shipped to executors; they connect (once per process) on first use.
+        state = self.__dict__.copy()
+        state['_hdfs'] = None
+        return state
+
     def _check_url(self, url, prefix, path):
-        print('_check_url: {}'.format(prefix))
+        logger.debug('_check_url prefix=%s', prefix)
         if prefix is not None and prefix != self.FS_PREFIX:
             raise ValueError('Mismatched HDFS namespace for URL: {}. Found {} but expected {}'
                              .format(url, prefix, self.FS_PREFIX))
@@ -129,4 +188,8 @@ class HDFSStore(FilesystemStore):
 
     def move(self, hdfs, local_path, hdfs_path):
         with open(local_path, 'rb') as f:
-            hdfs.upload(hdfs_path, f)
+            try:
+                hdfs.upload(hdfs_path, f, buffer_size=UPLOAD_BUFFER_SIZE)
+            except OSError as e:
+                self._discard_filesystem(hdfs, e)
+                raise
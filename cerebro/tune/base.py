@@ -175,35 +175,36 @@ class ModelSelection(object):
 
     def fit(self, df):
         """
-        Execute the model selection/AutoML workload on the given DataFrame.
+        Execute the model selection/AutoML workload on the given DataFrame. Only the feature, label, and validation
+        columns are read from `df`; other columns are not written to the store.
 
         :param df: Input DataFrame
         :return: cerebro.tune.ModelSelectionResult
         """
-        if self.verbose >= 1: print(
-            'CEREBRO => Time: {}, Preparing Data'.format(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-        _, _, metadata, _ = self.backend.prepare_data(self.store, df, self.validation)
+        self._log('Preparing Data')
+        cols = self.feature_cols + self.label_cols
+        if isinstance(self.validation, str) and self.validation in df.columns:
+            cols = cols + [self.validation]
+        df = df.select(*cols).persist()
+        try:
+            _, _, metadata, _ = self.backend.prepare_data(self.store, df, self.validation)
+        finally:
+            df.unpersist()
 
-        if self.verbose >= 1: print(
-            'CEREBRO => Time: {}, Initializing Workers'.format(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self._log('Initializing Workers')
         # initialize backend and data loaders
         self.backend.initialize_workers()
 
-        if self.verbose >= 1: print(
-            'CEREBRO => Time: {}, Initializing Data Loaders'.format(
-                datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self._log('Initializing Data Loaders')
         self.backend.initialize_data_loaders(self.store, self.feature_cols + self.label_cols)
 
         try:
-            if self.verbose >= 1: print('CEREBRO => Time: {}, Launching Model Selection Workload'.format(
-                datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            self._log('Launching Model Selection Workload')
             result = self._fit_on_prepared_data(metadata)
             return result
         finally:
             # teardown the backend workers
-            if self.verbose >= 1: print(
-                'CEREBRO => Time: {}, Terminating Workers'.format(
-                    datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            self._log('Terminating Workers')
             if self.backend is not None:
                 self.backend.teardown_workers()
 
@@ -216,31 +217,29 @@ class ModelSelection(object):
         _, _, metadata, _ = self.backend.get_metadata_from_parquet(self.store, self.label_cols, self.feature_cols)
 
         # initialize backend and data loaders
-        if self.verbose >= 1: print(
-            'CEREBRO => Time: {}, Initializing Workers'.format(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self._log('Initializing Workers')
         self.backend.initialize_workers()
 
-        if self.verbose >= 1: print(
-            'CEREBRO => Time: {}, Initializing Data Loaders'.format(
-                datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self._log('Initializing Data Loaders')
         self.backend.initialize_data_loaders(self.store, self.feature_cols + self.label_cols)
 
         try:
-            if self.verbose >= 1: print('CEREBRO => Time: {}, Launching Model Selection Workload'.format(
-                datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            self._log('Launching Model Selection Workload')
             result = self._fit_on_prepared_data(metadata)
             return result
         finally:
             # teardown the backend workers
-            if self.verbose >= 1: print(
-                'CEREBRO => Time: {}, Terminating Workers'.format(
-                    datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            self._log('Terminating Workers')
             if self.backend is not None:
                 self.backend.teardown_workers()
 
     def _fit_on_prepared_data(self):
         raise NotImplementedError('method not implemented')
 
+    def _log(self, message):
+        if self.verbose >= 1:
+            print('CEREBRO => Time: {:%Y-%m-%d %H:%M:%S}, {}'.format(datetime.datetime.now(), message))
+
     def _estimator_gen_fn_wrapper(self, params):
         return estimator_gen_fn_wrapper(self.estimator_gen_fn, params, self.feature_cols, self.label_cols, self.store, self.verbose)
 
@@ -14,7 +14,6 @@
 # ==============================================================================
 import os
 import itertools
-import datetime
 import tensorflow as tf
 from sqlalchemy import and_
 import numpy as np
@@ -245,13 +244,10 @@ def _fit_on_prepared_data(self, metadata):
 def _hil_fit_on_prepared_data(self):
     _, _, metadata, _ = self.backend.get_metadata_from_parquet(self.store, self.label_cols, self.feature_cols)
 
-    if self.verbose >= 1: print(
-        'CEREBRO => Time: {}, Initializing Data Loaders'.format(
-            datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    self._log('Initializing Data Loaders')
     self.backend.initialize_data_loaders(self.store, self.feature_cols + self.label_cols)
 
-    if self.verbose >= 1: print('CEREBRO => Time: {}, Launching Model Selection Workload'.format(
-        datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    self._log('Launching Model Selection Workload')
 
     exp_id = self.exp_id
     exp_obj = Experiment.query.filter(Experiment.id == exp_id).one()
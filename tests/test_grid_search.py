@@ -15,6 +15,7 @@
 
 import unittest
 
+import pyspark.sql.functions as f
 import tensorflow as tf
 from cerebro.backend import SparkBackend
 from cerebro.keras import SparkEstimator
@@ -104,6 +105,39 @@ class TestGridSearch(unittest.TestCase):
 
         assert True
 
+    def test_fit_prepares_projected_data(self):
+        spark = SparkSession \
+            .builder \
+            .master("local[3]") \
+            .appName("Python Spark SQL basic example") \
+            .getOrCreate()
+
+        # Load training data, with an unused column and a boolean validation column
+        df = spark.read.format("libsvm").load("./tests/sample_libsvm_data.txt") \
+            .withColumn('unused', f.lit(1.0)) \
+            .withColumn('is_val', f.rand(seed=2020) < 0.25) \
+            .repartition(8) \
+            .cache()
+
+        backend = SparkBackend(spark_context=spark.sparkContext, num_workers=3)
+        store = LocalStore('/tmp', train_path='/tmp/projected_train_data', val_path='/tmp/projected_val_data')
+
+        search_space = {'lr': hp_choice([0.01])}
+
+        grid_search = GridSearch(backend, store, estimator_gen_fn, search_space, 1,
+                                 validation='is_val', evaluation_metric='loss',
+                                 feature_columns=['features'], label_columns=['label'])
+        grid_search.fit(df)
+
+        train_df = spark.read.parquet(store.get_train_data_path())
+        val_df = spark.read.parquet(store.get_val_data_path())
+        self.assertEqual(sorted(train_df.columns), ['features', 'label'])
+        self.assertEqual(sorted(val_df.columns), ['features', 'label'])
+
+        num_val_rows = df.filter(f.col('is_val')).count()
+        self.assertEqual(val_df.count(), num_val_rows)
+        self.assertEqual(train_df.count(), df.count() - num_val_rows)
+
     def test_prepare_data(self):
         spark = SparkSession \
             .builder \
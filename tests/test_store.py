@@ -0,0 +1,191 @@
+# Copyright 2020 Supun Nakandala, Yuhao Zhang, and Arun Kumar. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import cloudpickle
+import pyarrow as pa
+
+from cerebro.storage import HDFSStore, LocalStore
+from cerebro.storage import hdfs as hdfs_store
+
+
+class RecordingLocalStore(LocalStore):
+    """LocalStore that records every move and can be told to fail on given files."""
+
+    def __init__(self, *args, **kwargs):
+        super(RecordingLocalStore, self).__init__(*args, **kwargs)
+        self.moves = []
+        self.failing = set()
+
+    def move(self, fs, local_path, remote_path):
+        if os.path.basename(local_path) in self.failing:
+            raise IOError('upload failed: {}'.format(local_path))
+        super(RecordingLocalStore, self).move(fs, local_path, remote_path)
+        self.moves.append((local_path, remote_path))
+
+
+def _write(path, content='x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+class TestFilesystemStoreSync(unittest.TestCase):
+
+    def setUp(self):
+        self.store_dir = tempfile.mkdtemp()
+        self.local_dir = tempfile.mkdtemp()
+        self.store = RecordingLocalStore(self.store_dir)
+        self.run_path = self.store.get_localized_path(self.store.get_run_path('run_0'))
+
+    def tearDown(self):
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+        shutil.rmtree(self.local_dir, ignore_errors=True)
+
+    def test_sync_nested_directories(self):
+        _write(os.path.join(self.local_dir, 'checkpoint.h5'))
+        _write(os.path.join(self.local_dir, 'logs', 'train', 'events.out'))
+        _write(os.path.join(self.local_dir, 'logs', 'validation', 'events.out'))
+
+        self.store.sync_fn('run_0')(self.local_dir)
+
+        remote_paths = sorted(self.store.get_localized_path(remote) for _, remote in self.store.moves)
+        self.assertEqual(remote_paths, [
+            os.path.join(self.run_path, 'checkpoint.h5'),
+            os.path.join(self.run_path, 'logs', 'train', 'events.out'),
+            os.path.join(self.run_path, 'logs', 'validation', 'events.out'),
+        ])
+        for path in remote_paths:
+            self.assertTrue(os.path.isfile(path))
+
+    def test_sync_skips_unmodified_files(self):
+        unchanged = os.path.join(self.local_dir, 'unchanged.txt')
+        modified = os.path.join(self.local_dir, 'sub', 'modified.txt')
+        _write(unchanged)
+        _write(modified)
+
+        sync = self.store.sync_fn('run_0')
+        sync(self.local_dir)
+        self.assertEqual(len(self.store.moves), 2)
+
+        mtime = os.path.getmtime(modified)
+        os.utime(modified, (mtime + 10, mtime + 10))
+        sync(self.local_dir)
+
+        self.assertEqual(len(self.store.moves), 3)
+        self.assertEqual(self.store.moves[-1][0], modified)
+
+    def test_sync_missing_local_dir(self):
+        # Callers such as log_hp_to_tensorboard sync a local output dir after it has been removed.
+        missing_dir = os.path.join(self.local_dir, 'does_not_exist')
+        self.store.sync_fn('run_0')(missing_dir)
+        self.assertEqual(self.store.moves, [])
+
+    def test_sync_failed_move_is_retried(self):
+        _write(os.path.join(self.local_dir, 'good.txt'))
+        _write(os.path.join(self.local_dir, 'bad.txt'))
+        self.store.failing.add('bad.txt')
+
+        sync = self.store.sync_fn('run_0')
+        with self.assertRaises(IOError):
+            sync(self.local_dir)
+        self.assertEqual([os.path.basename(local) for local, _ in self.store.moves], ['good.txt'])
+
+        # The failed file must not have been recorded as uploaded.
+        self.store.failing.clear()
+        sync(self.local_dir)
+        self.assertEqual([os.path.basename(local) for local, _ in self.store.moves], ['good.txt', 'bad.txt'])
+
+
+class TestHDFSStore(unittest.TestCase):
+
+    def setUp(self):
+        hdfs_store._HDFS_CONNECTIONS.clear()
+        patcher = mock.patch.object(pa.hdfs, 'connect', autospec=True)
+        self.connect = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(hdfs_store._HDFS_CONNECTIONS.clear)
+
+    def test_connection_is_shared(self):
+        store = HDFSStore('hdfs://namenode01:8020/user/test/cerebro')
+        other = HDFSStore('hdfs://namenode01:8020/user/test/other')
+        self.assertIs(store.get_filesystem(), other.get_filesystem())
+        self.assertEqual(self.connect.call_count, 1)
+
+    def test_failed_connection_is_evicted(self):
+        store = HDFSStore('hdfs://namenode01:8020/user/test/cerebro')
+        broken = store.get_filesystem()
+        broken.exists.side_effect = IOError('connection closed')
+
+        with self.assertRaises(IOError):
+            store.exists('/user/test/cerebro/runs')
+
+        self.connect.return_value = mock.MagicMock()
+        self.assertIsNot(store.get_filesystem(), broken)
+        self.assertEqual(self.connect.call_count, 2)
+
+    def test_failed_upload_is_evicted(self):
+        store = HDFSStore('hdfs://namenode01:8020/user/test/cerebro')
+        broken = store.get_filesystem()
+        broken.upload.side_effect = IOError('connection closed')
+
+        with tempfile.TemporaryDirectory() as local_dir:
+            with open(os.path.join(local_dir, 'checkpoint.h5'), 'w') as f:
+                f.write('x')
+            sync = store.sync_fn('run_0')
+            with self.assertRaises(IOError):
+                sync(local_dir)
+
+            self.connect.return_value = mock.MagicMock()
+            sync(local_dir)
+
+        self.assertEqual(self.connect.call_count, 2)
+        self.connect.return_value.upload.assert_called_once()
+
+    def test_missing_files_keep_connection(self):
+        store = HDFSStore('hdfs://namenode01:8020/user/test/cerebro')
+        hdfs = store.get_filesystem()
+        hdfs.open.side_effect = FileNotFoundError('no such file')
+
+        with self.assertRaises(FileNotFoundError):
+            store.read('/user/test/cerebro/runs/run_0/checkpoint.h5')
+        with self.assertRaises(FileNotFoundError):
+            store.move(hdfs, '/does/not/exist/checkpoint.h5', '/user/test/cerebro/runs/run_0/checkpoint.h5')
+
+        self.assertIs(store.get_filesystem(), hdfs)
+        self.assertEqual(self.connect.call_count, 1)
+
+    def test_remote_store_is_picklable(self):
+        store = HDFSStore('hdfs://namenode01:8020/user/test/cerebro')
+        remote_store = cloudpickle.loads(cloudpickle.dumps(store.to_remote('run_0', None)))
+        self.assertEqual(remote_store.run_path, store.get_run_path('run_0'))
+
+        # The unpickled store reconnects lazily through the per-process connection cache.
+        hdfs_store._HDFS_CONNECTIONS.clear()
+        with tempfile.TemporaryDirectory() as local_dir:
+            with open(os.path.join(local_dir, 'checkpoint.h5'), 'w') as f:
+                f.write('x')
+            remote_store.sync(local_dir)
+        self.assertEqual(self.connect.call_count, 2)
+        self.connect.return_value.upload.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()